@@ -5,6 +5,7 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
@@ -12,10 +13,19 @@ import os
 from pathlib import Path
 from .backend import routers, database
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Make sure the indexes used by the queries exist before serving requests
+    database.ensure_indexes()
+    yield
+
+
 # Initialize web host
 app = FastAPI(
     title="Mergington High School API",
-    description="API for viewing and signing up for extracurricular activities"
+    description="API for viewing and signing up for extracurricular activities",
+    lifespan=lifespan
 )
 
 # Initialize database with sample data if empty
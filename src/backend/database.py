@@ -2,16 +2,60 @@
 MongoDB database configuration and setup for Mergington High School API
 """
 
-from pymongo import MongoClient
+from datetime import datetime, timezone
+from bson import ObjectId
+from bson.codec_options import CodecOptions, TypeDecoder, TypeRegistry
+from pymongo import MongoClient, ASCENDING, DESCENDING
+from motor.motor_asyncio import AsyncIOMotorClient
 from argon2 import PasswordHasher, exceptions as argon2_exceptions
+import logging
+
+logger = logging.getLogger(__name__)
+
+MONGODB_URI = 'mongodb://localhost:27017/'
+DATABASE_NAME = 'mergington_high'
+
+# Connection pool settings shared by both clients. Each client is created
+# once at import time and reused by every request.
+CLIENT_OPTIONS = {
+    "maxPoolSize": 50,
+    "minPoolSize": 5,
+    "waitQueueTimeoutMS": 2000,
+    "retryWrites": True
+}
 
 # Connect to MongoDB
-client = MongoClient('mongodb://localhost:27017/')
-db = client['mergington_high']
+client = MongoClient(MONGODB_URI, **CLIENT_OPTIONS)
+db = client[DATABASE_NAME]
 activities_collection = db['activities']
 teachers_collection = db['teachers']
 announcements_collection = db['announcements']
 
+
+class ObjectIdAsStr(TypeDecoder):
+    """Decode ObjectId values as strings so documents are JSON ready"""
+    bson_type = ObjectId
+
+    def transform_bson(self, value):
+        return str(value)
+
+
+# Async (Motor) connection for endpoints implemented with ``async def``.
+# ObjectIds are decoded as strings while reading, so the endpoints don't
+# need to convert ``_id`` values themselves, and dates are decoded as
+# timezone-aware UTC datetimes so timestamps are always emitted with an offset.
+async_client = AsyncIOMotorClient(MONGODB_URI, **CLIENT_OPTIONS)
+async_db = async_client.get_database(
+    DATABASE_NAME,
+    codec_options=CodecOptions(
+        tz_aware=True,
+        tzinfo=timezone.utc,
+        type_registry=TypeRegistry([ObjectIdAsStr()])
+    )
+)
+async_teachers_collection = async_db['teachers']
+async_announcements_collection = async_db['announcements']
+
 # Methods
 
 
@@ -56,6 +100,56 @@ def init_database():
         for announcement in initial_announcements:
             announcements_collection.insert_one(announcement)
 
+    # Convert announcement dates and timestamps stored as ISO strings into BSON dates
+    migrate_announcement_dates()
+
+    # Store an explicit null start_date so the active query needs no $exists
+    announcements_collection.update_many(
+        {"start_date": {"$exists": False}}, {"$set": {"start_date": None}})
+
+
+def migrate_announcement_dates():
+    """Convert legacy string dates and timestamps into BSON dates.
+
+    Values that can't be parsed are logged and stored as null, except
+    ``created_at``, which falls back to the ObjectId's timestamp.
+    """
+    for field in ("start_date", "expiration_date", "created_at", "updated_at"):
+        for announcement in announcements_collection.find(
+                {field: {"$type": "string"}}, {field: 1}):
+            value = announcement[field]
+            try:
+                converted = datetime.fromisoformat(value) if value else None
+            except ValueError:
+                # Older versions stored any non-empty string, so one bad value
+                # must not stop the app from starting
+                logger.warning("Announcement %s has an invalid %s %r",
+                               announcement["_id"], field, value)
+                converted = None
+            # Listing and paging need created_at, so fall back to the
+            # creation time encoded in the ObjectId
+            if (field == "created_at" and converted is None
+                    and isinstance(announcement["_id"], ObjectId)):
+                converted = announcement["_id"].generation_time
+            announcements_collection.update_one(
+                {"_id": announcement["_id"]},
+                {"$set": {field: converted}}
+            )
+
+
+def ensure_indexes():
+    """Create the indexes used by the announcements queries.
+
+    Index creation is idempotent, so this is safe to run on every startup.
+    Teachers are looked up by ``_id``, which MongoDB always indexes.
+    """
+    # Active announcements: range on expiration_date, then start_date
+    announcements_collection.create_index(
+        [("expiration_date", ASCENDING), ("start_date", ASCENDING)])
+    # Management list: newest first
+    announcements_collection.create_index(
+        [("created_at", DESCENDING), ("_id", DESCENDING)])
+
 
 # Initial database if empty
 initial_activities = {
@@ -217,9 +311,9 @@ initial_teachers = [
 initial_announcements = [
     {
         "message": "📢 Activity registration is open until the end of the month. Don't lose your spot!",
-        "start_date": "2026-02-01",
-        "expiration_date": "2026-02-28",
+        "start_date": datetime(2026, 2, 1),
+        "expiration_date": datetime(2026, 2, 28),
         "created_by": "principal",
-        "created_at": "2026-02-01T10:00:00"
+        "created_at": datetime(2026, 2, 1, 10, 0)
     }
 ]
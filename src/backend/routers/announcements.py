@@ -21,6 +21,9 @@ Endpoints
   None (public endpoint).
 - Query parameters:
   None.
+- Caching:
+  Responses are cached in-process for up to 30 seconds and the cache is
+  cleared whenever an announcement is created, updated or deleted.
 - Response:
   A JSON array of announcement objects. Each object has:
   - ``_id`` (string): Announcement identifier.
@@ -30,24 +33,41 @@ Endpoints
   - ``expiration_date`` (string): ISO date (YYYY-MM-DD) when the
     announcement expires.
   - ``created_by`` (string): ID of the teacher that created the announcement.
-  - ``created_at`` (string): ISO 8601 timestamp of creation.
+  - ``created_at`` (string): ISO 8601 timestamp of creation (UTC).
 
 2. GET /announcements/all
 -------------------------
 - Description:
   Return **all** announcements for use in the management interface
   (including expired or not-yet-active announcements), sorted by
-  ``created_at`` descending (newest first).
+  ``created_at`` descending (newest first). Results are paginated.
 - Authentication:
   Required. Caller must supply a valid teacher username.
 - Query parameters:
   - ``username`` (string, required): The teacher's identifier. The value
     must match a document ``{"_id": username}`` in ``teachers_collection``.
+  - ``limit`` (integer, optional): Maximum number of announcements to
+    return, between 1 and 500. Defaults to 100.
+  - ``before`` (string, optional): Opaque, URL-safe page cursor. Pass
+    the ``next_before`` value of the previous page to fetch the next one.
 - Errors:
+  - ``400 Invalid cursor`` if ``before`` is not a value returned as
+    ``next_before``.
   - ``401 Authentication required`` if the username does not correspond
     to an existing teacher.
+  As with the other management routes, the request is validated before
+  the username is checked, so a bad cursor returns ``400`` even when the
+  caller is not authenticated.
 - Response:
-  A JSON array of announcement objects (same shape as in ``GET /announcements``).
+  A JSON object, streamed while the announcements are read. The page
+  query is started before the response begins, so a failing query returns
+  ``500``; an error while later batches are read can only cut the
+  response short. The object has:
+  - ``announcements``: Array of announcement objects (same shape as in
+    ``GET /announcements``).
+  - ``next_before`` (string | null): Cursor for the next page, or null
+    when there are no more announcements.
+  - ``total`` (integer): Approximate number of announcements stored.
 
 3. POST /announcements
 ----------------------
@@ -55,21 +75,23 @@ Endpoints
   Create a new announcement.
 - Authentication:
   Required. Caller must supply a valid teacher username.
-- Body / form parameters:
-  - ``message`` (string, required): The announcement text. Must not be
-    empty or whitespace-only.
-  - ``expiration_date`` (string, required): ISO date (YYYY-MM-DD) when
-    the announcement expires. This field must be provided.
+- Query parameters:
   - ``username`` (string, required): The teacher's identifier. Must
     correspond to a document in ``teachers_collection``.
+- JSON body:
+  - ``message`` (string, required): The announcement text. Surrounding
+    whitespace is trimmed and it must not be empty.
+  - ``expiration_date`` (string, required): ISO date (YYYY-MM-DD) when
+    the announcement expires. This field must be provided.
   - ``start_date`` (string | null, optional): ISO date (YYYY-MM-DD)
     when the announcement should begin to be shown. If omitted or null,
     the announcement is considered active immediately (subject to
     ``expiration_date``).
 - Errors:
+  - ``422`` if the body is invalid: ``Message is required``,
+    ``Expiration date is required``, ``Invalid start date`` or
+    ``Invalid expiration date``.
   - ``401 Authentication required`` if the username is not a valid teacher.
-  - ``400 Expiration date is required`` if ``expiration_date`` is missing.
-  - ``400 Message is required`` if ``message`` is empty or whitespace.
 - Response:
   The created announcement object, including its generated ``_id``.
 
@@ -82,20 +104,26 @@ Endpoints
 - Path parameters:
   - ``announcement_id`` (string, required): The identifier of the
     announcement to update.
-- Body / form parameters:
+- Query parameters:
+  - ``username`` (string, required): The teacher's identifier. Must
+    correspond to a document in ``teachers_collection``.
+- JSON body:
   - ``message`` (string, required): New announcement text.
   - ``expiration_date`` (string, required): New expiration date
     (ISO date, YYYY-MM-DD).
-  - ``username`` (string, required): The teacher's identifier. Must
-    correspond to a document in ``teachers_collection``.
   - ``start_date`` (string | null, optional): New start date (ISO date,
-    YYYY-MM-DD) or null to remove a previously set start date.
+    YYYY-MM-DD), an empty string to remove a previously set start date,
+    or omitted/null to keep the current value.
 - Errors:
+  - ``400 Invalid announcement ID`` if ``announcement_id`` is malformed.
+  - ``422`` if the body is invalid (same checks as ``POST /announcements``).
   - ``401 Authentication required`` if the username is not a valid teacher.
   - ``404 Announcement not found`` if the given ``announcement_id`` does
     not exist.
 - Response:
-  The updated announcement object.
+  The updated announcement object, with ``updated_by`` (string) and
+  ``updated_at`` (string, ISO 8601 timestamp, UTC) in addition to the
+  fields returned by ``GET /announcements``.
 
 5. DELETE /announcements/{announcement_id}
 ------------------------------------------
@@ -116,21 +144,62 @@ Endpoints
 - Response:
   JSON object with a confirmation message (e.g., ``{"detail": "Deleted"}``).
 
+6. POST /announcements/bulk
+---------------------------
+- Description:
+  Create several announcements in a single database round-trip.
+- Authentication:
+  Required. Caller must supply a valid teacher username.
+- Query parameters:
+  - ``username`` (string, required): The teacher's identifier. Must
+    correspond to a document in ``teachers_collection``.
+- JSON body:
+  An array of 1 to 100 announcement objects, each with the same fields
+  as the body of ``POST /announcements``.
+- Errors:
+  - ``422`` if the array is empty, too long, or any item is invalid.
+  - ``401 Authentication required`` if the username is not a valid teacher.
+  - ``500`` if only some announcements could be stored. ``detail`` then
+    holds ``message``, ``failed`` (indexes of the items that were not
+    created) and ``inserted`` (the announcement objects that were).
+- Response:
+  The created announcement objects, in the order they were submitted.
+
 Security and data handling
 --------------------------
 - These endpoints rely on the ``teachers_collection`` to validate the
-  ``username`` parameter for management actions (list all, create, update,
-  delete).
+  ``username`` parameter for management actions (list all, create, bulk
+  create, update, delete). The set of teacher usernames is cached
+  in-process for up to 60 seconds, so newly added or removed teachers
+  take effect within a minute.
+- ``start_date`` and ``expiration_date`` are stored as BSON dates so the
+  active-announcements query can use the ``(expiration_date, start_date)``
+  index; they are converted back to ISO date strings in responses.
+  ``start_date`` is always stored, as null when the announcement has no
+  start date.
 - Only minimal error details are returned to clients; errors should be
   logged server-side as needed.
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from fastapi import APIRouter, Body, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Dict, Any, Optional, FrozenSet, AsyncIterator
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
+from time import monotonic
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
+import logging
+import orjson
 
-from ..database import announcements_collection, teachers_collection
+from ..database import (
+    async_announcements_collection as announcements_collection,
+    async_teachers_collection as teachers_collection,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/announcements",
@@ -138,113 +207,364 @@ router = APIRouter(
 )
 
 
-@router.get("")
-def get_active_announcements() -> List[Dict[str, Any]]:
+def _check_iso_date(value: str, field_name: str) -> str:
+    """Raise ValueError unless value is an ISO date (YYYY-MM-DD)"""
+    # strptime rejects compact dates, times and offsets; the length check
+    # also rejects unpadded values such as 2099-1-1
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise ValueError(f"Invalid {field_name}")
+    if len(value) != 10:
+        raise ValueError(f"Invalid {field_name}")
+    return value
+
+
+class AnnouncementIn(BaseModel):
+    """Announcement fields accepted when creating or updating"""
+    message: str
+    expiration_date: str
+    start_date: Optional[str] = None
+
+    @field_validator("message")
+    @classmethod
+    def strip_message(cls, value: str) -> str:
+        value = value.strip()
+        if not value:
+            raise ValueError("Message is required")
+        return value
+
+    @field_validator("expiration_date")
+    @classmethod
+    def check_expiration_date(cls, value: str) -> str:
+        if not value:
+            raise ValueError("Expiration date is required")
+        return _check_iso_date(value, "expiration date")
+
+    @field_validator("start_date")
+    @classmethod
+    def check_start_date(cls, value: Optional[str]) -> Optional[str]:
+        # An empty string is allowed: on update it clears the start date
+        if value:
+            _check_iso_date(value, "start date")
+        return value
+
+
+class AnnouncementOut(BaseModel):
+    """Announcement as returned by the API"""
+    id: str = Field(alias="_id")
+    message: str
+    start_date: Optional[str] = None
+    expiration_date: str
+    created_by: str
+    created_at: datetime
+
+
+class UpdatedAnnouncementOut(AnnouncementOut):
+    """Announcement as returned after an update"""
+    updated_by: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+
+class AnnouncementPage(BaseModel):
+    """One page of announcements for the management interface"""
+    announcements: List[AnnouncementOut]
+    next_before: Optional[str] = None
+    total: int
+
+
+# Announcement date fields are stored as BSON dates but exposed as YYYY-MM-DD
+DATE_FIELDS = ("start_date", "expiration_date")
+
+# Projection used by the list endpoints so the server returns only the fields
+# the frontend needs, already converted to JSON friendly values
+LIST_PROJECTION = {
+    "_id": 1,
+    "message": 1,
+    "start_date": {"$dateToString": {"date": "$start_date", "format": "%Y-%m-%d"}},
+    "expiration_date": {"$dateToString": {"date": "$expiration_date", "format": "%Y-%m-%d"}},
+    "created_by": 1,
+    "created_at": 1
+}
+
+# Short-lived in-process cache for the public active announcements list.
+# Holds the encoded JSON body, keyed by the current date. Every write bumps
+# ``version``, which both expires the entry and stops a read that started
+# before the write from storing its (now stale) result.
+ACTIVE_CACHE_TTL_SECONDS = 30
+_active_cache: Dict[str, Any] = {"key": None, "expires_at": 0.0, "body": b"", "version": 0}
+
+
+def _invalidate_active_cache() -> None:
+    """Drop the cached active announcements after a write"""
+    _active_cache["version"] += 1
+    _active_cache["expires_at"] = 0.0
+
+
+# Teacher accounts change rarely, so the set of valid usernames is cached
+# in-process and refreshed from the database at most once a minute.
+TEACHER_CACHE_TTL_SECONDS = 60
+_teacher_cache: Dict[str, Any] = {"expires_at": 0.0, "ids": frozenset()}
+
+
+async def _teacher_ids_snapshot() -> FrozenSet[str]:
+    """Return the cached set of teacher usernames, refreshing it when stale"""
+    if _teacher_cache["expires_at"] <= monotonic():
+        teacher_ids = await teachers_collection.distinct("_id")
+        _teacher_cache.update(
+            expires_at=monotonic() + TEACHER_CACHE_TTL_SECONDS,
+            ids=frozenset(teacher_ids)
+        )
+    return _teacher_cache["ids"]
+
+
+async def _require_teacher(username: str) -> None:
+    """Raise 401 unless the username belongs to an existing teacher"""
+    if username not in await _teacher_ids_snapshot():
+        raise HTTPException(status_code=401, detail="Authentication required")
+
+
+@lru_cache(maxsize=1)
+def _today(minute_bucket: int) -> datetime:
+    """Return today's date at midnight, computed once per minute bucket"""
+    return datetime.combine(datetime.now().date(), time.min)
+
+
+def _utc_now() -> datetime:
+    """Current UTC time truncated to the millisecond precision BSON keeps"""
+    now = datetime.now(timezone.utc)
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+def _parse_date(value: str) -> datetime:
+    """Convert a validated ISO date string into a datetime for storage"""
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def _new_announcement(body: AnnouncementIn, username: str) -> Dict[str, Any]:
+    """Build the document stored for a newly created announcement"""
+    return {
+        "message": body.message,
+        "start_date": _parse_date(body.start_date) if body.start_date else None,
+        "expiration_date": _parse_date(body.expiration_date),
+        "created_by": username,
+        "created_at": _utc_now()
+    }
+
+
+# Page cursors store created_at as milliseconds since this instant
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _page_cursor(announcement: Dict[str, Any]) -> str:
+    """Build the ``next_before`` cursor pointing after this announcement.
+
+    The cursor is ``<created_at as epoch milliseconds>_<id>``, which only
+    uses URL-safe characters.
+    """
+    millis = (announcement["created_at"] - EPOCH) // timedelta(milliseconds=1)
+    return f"{millis}_{announcement['_id']}"
+
+
+def _parse_page_cursor(cursor: str) -> Dict[str, Any]:
+    """Turn a ``before`` cursor into the filter matching older announcements"""
+    try:
+        millis, announcement_id = cursor.split("_")
+        if not millis.isdigit():
+            raise ValueError(millis)
+        created_at = EPOCH + timedelta(milliseconds=int(millis))
+        obj_id = ObjectId(announcement_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # created_at only has millisecond precision, so ties are broken by _id
+    return {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "_id": {"$lt": obj_id}}
+    ]}
+
+
+async def _stream_announcements_page(
+    cursor: Any,
+    first: List[Dict[str, Any]],
+    limit: int,
+    total: int
+) -> AsyncIterator[bytes]:
+    """Encode one AnnouncementPage as JSON while the cursor is iterated.
+
+    ``first`` holds the documents already read from ``cursor`` before the
+    response started. The pipeline fetches ``limit + 1`` documents; the
+    extra one only tells whether another page exists and is not part of
+    the response.
+    """
+    async def documents() -> AsyncIterator[Dict[str, Any]]:
+        for announcement in first:
+            yield announcement
+        async for announcement in cursor:
+            yield announcement
+
+    yield b'{"announcements":['
+    count = 0
+    last_announcement = None
+    has_more = False
+    async for announcement in documents():
+        if count == limit:
+            has_more = True
+            break
+        yield (b"," if count else b"") + orjson.dumps(announcement, option=orjson.OPT_UTC_Z)
+        count += 1
+        last_announcement = announcement
+
+    next_before = _page_cursor(last_announcement) if has_more else None
+    yield b'],"next_before":' + orjson.dumps(next_before) + b',"total":' + orjson.dumps(total) + b"}"
+
+
+def _serialize_announcement(announcement: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an announcement document's dates into YYYY-MM-DD strings"""
+    for field in DATE_FIELDS:
+        value = announcement.get(field)
+        if isinstance(value, datetime):
+            announcement[field] = value.date().isoformat()
+    return announcement
+
+
+# The list routes return pre-encoded/streamed bodies, so the models are only
+# used to document the response schema
+@router.get("", response_class=Response, responses={200: {"model": List[AnnouncementOut]}})
+async def get_active_announcements() -> Response:
     """Get all active announcements (within date range)"""
-    current_date = datetime.now().date().isoformat()
+    today = _today(int(monotonic()) // 60)
+
+    # Serve from the cache while it is fresh and still for the same day
+    if _active_cache["key"] == today and _active_cache["expires_at"] > monotonic():
+        return Response(content=_active_cache["body"], media_type="application/json")
+
+    # Remember the version so a write during the query isn't overwritten
+    version = _active_cache["version"]
     
     # Find announcements that are active (current date is within start and expiration dates)
-    announcements = list(
-        announcements_collection
-        .find({
-            "$or": [
-                {"start_date": {"$exists": False}},
-                {"start_date": None},
-                {"start_date": {"$lte": current_date}}
-            ],
-            "expiration_date": {"$gte": current_date}
-        })
+    pipeline = [
+        # start_date is always present (null when unset); "not after today"
+        # matches both null and past dates with a single indexable predicate
+        {"$match": {
+            "expiration_date": {"$gte": today},
+            "start_date": {"$not": {"$gt": today}}
+        }},
         # Ensure deterministic ordering so announcements[0] is stable on the frontend
-        .sort([("start_date", -1), ("created_at", -1)])
-    )
-    
-    # Convert ObjectId to string for JSON serialization
-    for announcement in announcements:
-        if "_id" in announcement:
-            announcement["_id"] = str(announcement["_id"])
+        {"$sort": {"start_date": -1, "created_at": -1}},
+        {"$project": LIST_PROJECTION}
+    ]
+    announcements = await announcements_collection.aggregate(pipeline).to_list(length=None)
+    # OPT_UTC_Z writes UTC timestamps with a "Z" suffix, as Pydantic does
+    body = orjson.dumps(announcements, option=orjson.OPT_UTC_Z)
+
+    if _active_cache["version"] == version:
+        _active_cache.update(
+            key=today,
+            expires_at=monotonic() + ACTIVE_CACHE_TTL_SECONDS,
+            body=body
+        )
     
-    return announcements
+    return Response(content=body, media_type="application/json")
 
 
-@router.get("/all")
-def get_all_announcements(username: str) -> List[Dict[str, Any]]:
+@router.get("/all", response_class=StreamingResponse, responses={200: {"model": AnnouncementPage}})
+async def get_all_announcements(
+    username: str,
+    limit: int = Query(100, ge=1, le=500),
+    before: Optional[str] = None
+) -> StreamingResponse:
     """Get all announcements (for management interface). Requires authentication."""
-    # Verify user is authenticated
-    teacher = teachers_collection.find_one({"_id": username})
-    if not teacher:
-        raise HTTPException(status_code=401, detail="Authentication required")
-    
-    # Get all announcements, sorted by creation date (newest first)
-    announcements = list(announcements_collection.find({}).sort("created_at", -1))
-    
-    # Convert ObjectId to string for JSON serialization
-    for announcement in announcements:
-        if "_id" in announcement:
-            announcement["_id"] = str(announcement["_id"])
+    match = _parse_page_cursor(before) if before else {}
+
+    # Verify user is authenticated once the request itself is known to be valid
+    await _require_teacher(username)
     
-    return announcements
+    # Get one page of announcements, sorted by creation date (newest first)
+    pipeline = [
+        {"$match": match},
+        {"$sort": {"created_at": -1, "_id": -1}},
+        {"$limit": limit + 1},
+        {"$project": LIST_PROJECTION}
+    ]
+    # Run the queries before streaming starts so database errors still
+    # produce a proper error response. The page query's first batch stays
+    # buffered in the cursor; only one document is taken from it here.
+    total = await announcements_collection.estimated_document_count()
+    cursor = announcements_collection.aggregate(pipeline)
+    first = await cursor.to_list(length=1)
 
+    # Stream the documents as they arrive instead of building the whole list
+    return StreamingResponse(
+        _stream_announcements_page(cursor, first, limit, total),
+        media_type="application/json"
+    )
 
-@router.post("")
-def create_announcement(
-    message: str,
-    expiration_date: str,
-    username: str,
-    start_date: Optional[str] = None
-) -> Dict[str, Any]:
+
+@router.post("", response_model=AnnouncementOut)
+async def create_announcement(body: AnnouncementIn, username: str) -> Dict[str, Any]:
     """Create a new announcement. Requires authentication."""
-    # Verify user is authenticated
-    teacher = teachers_collection.find_one({"_id": username})
-    if not teacher:
-        raise HTTPException(status_code=401, detail="Authentication required")
-    
-    # Validate expiration_date is provided
-    if not expiration_date:
-        raise HTTPException(status_code=400, detail="Expiration date is required")
-    
-    # Validate message is not empty
-    if not message or not message.strip():
-        raise HTTPException(status_code=400, detail="Message is required")
-    
     # Create announcement document
-    announcement = {
-        "message": message.strip(),
-        "start_date": start_date,
-        "expiration_date": expiration_date,
-        "created_by": username,
-        "created_at": datetime.now().isoformat()
-    }
+    announcement = _new_announcement(body, username)
     
+    # Verify user is authenticated once the request itself is known to be valid
+    await _require_teacher(username)
+
     # Insert into database
-    result = announcements_collection.insert_one(announcement)
+    result = await announcements_collection.insert_one(announcement)
+    _invalidate_active_cache()
     
     # Return the created announcement with its ID
     announcement["_id"] = str(result.inserted_id)
-    return announcement
+    return _serialize_announcement(announcement)
 
 
-@router.put("/{announcement_id}")
-def update_announcement(
-    announcement_id: str,
-    message: str,
-    expiration_date: str,
+@router.post("/bulk", response_model=List[AnnouncementOut])
+async def create_announcements_bulk(
     username: str,
-    start_date: Optional[str] = None
+    body: List[AnnouncementIn] = Body(..., min_length=1, max_length=100)
+) -> List[Dict[str, Any]]:
+    """Create several announcements at once. Requires authentication."""
+    announcements = [_new_announcement(item, username) for item in body]
+
+    # Verify user is authenticated once the request itself is known to be valid
+    await _require_teacher(username)
+
+    # Insert all announcements in a single round-trip. The insert is
+    # unordered, so some documents may be stored even if others fail.
+    try:
+        result = await announcements_collection.insert_many(announcements, ordered=False)
+    except BulkWriteError as error:
+        logger.error("Bulk announcement insert partially failed: %s", error.details)
+        failed = sorted({write_error["index"] for write_error in error.details["writeErrors"]})
+        # HTTPException details are encoded with json, so dump through the model
+        inserted = [
+            AnnouncementOut.model_validate(
+                _serialize_announcement({**announcement, "_id": str(announcement["_id"])})
+            ).model_dump(mode="json", by_alias=True)
+            for index, announcement in enumerate(announcements)
+            if index not in failed
+        ]
+        raise HTTPException(status_code=500, detail={
+            "message": "Some announcements could not be created",
+            "failed": failed,
+            "inserted": inserted
+        })
+    finally:
+        _invalidate_active_cache()
+
+    for announcement, inserted_id in zip(announcements, result.inserted_ids):
+        announcement["_id"] = str(inserted_id)
+    return [_serialize_announcement(announcement) for announcement in announcements]
+
+
+@router.put("/{announcement_id}", response_model=UpdatedAnnouncementOut)
+async def update_announcement(
+    announcement_id: str,
+    body: AnnouncementIn,
+    username: str
 ) -> Dict[str, Any]:
     """Update an existing announcement. Requires authentication."""
-    # Verify user is authenticated
-    teacher = teachers_collection.find_one({"_id": username})
-    if not teacher:
-        raise HTTPException(status_code=401, detail="Authentication required")
-    
-    # Validate expiration_date is provided
-    if not expiration_date:
-        raise HTTPException(status_code=400, detail="Expiration date is required")
-    
-    # Validate message is not empty
-    if not message or not message.strip():
-        raise HTTPException(status_code=400, detail="Message is required")
-    
     # Convert string ID to ObjectId
     try:
         obj_id = ObjectId(announcement_id)
@@ -253,59 +573,57 @@ def update_announcement(
     
     # Update the announcement
     update_data = {
-        "message": message.strip(),
-        "expiration_date": expiration_date,
+        "message": body.message,
+        "expiration_date": _parse_date(body.expiration_date),
         "updated_by": username,
-        "updated_at": datetime.now().isoformat()
+        "updated_at": _utc_now()
     }
-    unset_data: Dict[str, Any] = {}
 
     # Handle start_date updates:
-    # - If explicitly provided as an empty string, clear the field.
+    # - If explicitly provided as an empty string, clear the field (set to null).
     # - If provided as a non-empty value, update it.
     # - If None, do not modify the existing value.
-    if start_date == "":
-        unset_data["start_date"] = 1
-    elif start_date is not None:
-        update_data["start_date"] = start_date
-
-    update_query: Dict[str, Any] = {"$set": update_data}
-    if unset_data:
-        update_query["$unset"] = unset_data
+    if body.start_date == "":
+        update_data["start_date"] = None
+    elif body.start_date is not None:
+        update_data["start_date"] = _parse_date(body.start_date)
+
+    update_query = {"$set": update_data}
+
+    # Verify user is authenticated once the request itself is known to be valid
+    await _require_teacher(username)
     
-    result = announcements_collection.update_one(
+    # Update and fetch the updated announcement in a single round-trip
+    announcement = await announcements_collection.find_one_and_update(
         {"_id": obj_id},
-        update_query
+        update_query,
+        return_document=ReturnDocument.AFTER
     )
     
-    if result.matched_count == 0:
+    if announcement is None:
         raise HTTPException(status_code=404, detail="Announcement not found")
+    _invalidate_active_cache()
     
-    # Fetch and return the updated announcement
-    announcement = announcements_collection.find_one({"_id": obj_id})
-    announcement["_id"] = str(announcement["_id"])
-    
-    return announcement
+    return _serialize_announcement(announcement)
 
 
 @router.delete("/{announcement_id}")
-def delete_announcement(announcement_id: str, username: str) -> Dict[str, str]:
+async def delete_announcement(announcement_id: str, username: str) -> Dict[str, str]:
     """Delete an announcement. Requires authentication."""
-    # Verify user is authenticated
-    teacher = teachers_collection.find_one({"_id": username})
-    if not teacher:
-        raise HTTPException(status_code=401, detail="Authentication required")
-    
     # Convert string ID to ObjectId
     try:
         obj_id = ObjectId(announcement_id)
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid announcement ID")
+
+    # Verify user is authenticated once the request itself is known to be valid
+    await _require_teacher(username)
     
     # Delete the announcement
-    result = announcements_collection.delete_one({"_id": obj_id})
+    result = await announcements_collection.delete_one({"_id": obj_id})
     
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Announcement not found")
+    _invalidate_active_cache()
     
     return {"message": "Announcement deleted successfully"}
@@ -56,6 +56,9 @@ document.addEventListener("DOMContentLoaded", () => {
   // Authentication state
   let currentUser = null;
 
+  // Announcements currently shown in the management modal
+  let managedAnnouncements = [];
+
   // Time range mappings for the dropdown
   const timeRanges = {
     morning: { start: "06:00", end: "08:00" }, // Before school hours
@@ -291,6 +294,36 @@ document.addEventListener("DOMContentLoaded", () => {
     }
   }
 
+  // Request every page of /announcements/all by following next_before.
+  // Returns the failed response if a page could not be loaded.
+  async function requestAllAnnouncements() {
+    const announcements = [];
+    let before = null;
+
+    do {
+      let url = `/announcements/all?username=${encodeURIComponent(currentUser.username)}`;
+      if (before) {
+        url += `&before=${encodeURIComponent(before)}`;
+      }
+
+      const response = await fetch(url);
+      if (!response.ok) {
+        return { response };
+      }
+
+      const data = await response.json();
+      if (!Array.isArray(data.announcements)) {
+        console.error("Unexpected announcements payload:", data);
+        return { response, announcements: null };
+      }
+
+      announcements.push(...data.announcements);
+      before = data.next_before;
+    } while (before);
+
+    return { announcements };
+  }
+
   // Fetch all announcements for management interface
   async function fetchAllAnnouncements() {
     if (!currentUser) {
@@ -299,15 +332,14 @@ document.addEventListener("DOMContentLoaded", () => {
     }
 
     try {
-      const response = await fetch(`/announcements/all?username=${encodeURIComponent(currentUser.username)}`);
+      const { response, announcements } = await requestAllAnnouncements();
       
-      if (!response.ok) {
-        const data = await response.json();
+      if (!announcements) {
+        const data = response.ok ? {} : await response.json();
         showAnnouncementMessage(data.detail || "Failed to load announcements", "error");
         return;
       }
 
-      const announcements = await response.json();
       displayAnnouncementsList(announcements);
     } catch (error) {
       console.error("Error fetching all announcements:", error);
@@ -317,6 +349,8 @@ document.addEventListener("DOMContentLoaded", () => {
 
   // Display announcements list in management modal
   function displayAnnouncementsList(announcements) {
+    managedAnnouncements = announcements;
+
     if (announcements.length === 0) {
       announcementsList.innerHTML = "<p>No announcements yet. Create your first one!</p>";
       return;
@@ -456,50 +490,27 @@ document.addEventListener("DOMContentLoaded", () => {
   }
 
   // Edit announcement
-  async function editAnnouncement(announcementId) {
-    try {
-      // Find the announcement from the current list
-      const response = await fetch(`/announcements/all?username=${encodeURIComponent(currentUser.username)}`);
-      
-      if (!response.ok) {
-        if (response.status === 401) {
-          showAnnouncementMessage("You are not authorized to view announcements. Please log in again.", "error");
-        } else {
-          showAnnouncementMessage("Failed to load announcements. Please try again later.", "error");
-        }
-        return;
-      }
-
-      const announcements = await response.json();
+  function editAnnouncement(announcementId) {
+    // Find the announcement in the list already shown in the modal
+    const announcement = managedAnnouncements.find(a => a._id === announcementId);
 
-      if (!Array.isArray(announcements)) {
-        console.error("Unexpected announcements payload:", announcements);
-        showAnnouncementMessage("Unexpected server response while loading announcement.", "error");
-        return;
-      }
-      const announcement = announcements.find(a => a._id === announcementId);
-      
-      if (!announcement) {
-        showAnnouncementMessage("Announcement not found", "error");
-        return;
-      }
-      
-      // Populate form
-      document.getElementById("announcement-id").value = announcement._id;
-      document.getElementById("announcement-message").value = announcement.message;
-      document.getElementById("announcement-start-date").value = announcement.start_date || "";
-      document.getElementById("announcement-expiration-date").value = announcement.expiration_date;
-      
-      formTitle.textContent = "Edit Announcement";
-      saveAnnouncementBtn.textContent = "Update Announcement";
-      cancelEditBtn.classList.remove("hidden");
-      
-      // Scroll to form
-      document.querySelector(".announcement-form-section").scrollIntoView({ behavior: "smooth" });
-    } catch (error) {
-      console.error("Error editing announcement:", error);
-      showAnnouncementMessage("Failed to load announcement", "error");
+    if (!announcement) {
+      showAnnouncementMessage("Announcement not found", "error");
+      return;
     }
+
+    // Populate form
+    document.getElementById("announcement-id").value = announcement._id;
+    document.getElementById("announcement-message").value = announcement.message;
+    document.getElementById("announcement-start-date").value = announcement.start_date || "";
+    document.getElementById("announcement-expiration-date").value = announcement.expiration_date;
+    
+    formTitle.textContent = "Edit Announcement";
+    saveAnnouncementBtn.textContent = "Update Announcement";
+    cancelEditBtn.classList.remove("hidden");
+    
+    // Scroll to form
+    document.querySelector(".announcement-form-section").scrollIntoView({ behavior: "smooth" });
   }
 
   // Delete announcement
@@ -576,45 +587,52 @@ document.addEventListener("DOMContentLoaded", () => {
     
     const announcementId = document.getElementById("announcement-id").value;
     const message = document.getElementById("announcement-message").value.trim();
+    const startDate = document.getElementById("announcement-start-date").value;
+    const expirationDate = document.getElementById("announcement-expiration-date").value;
+
+    try {
+      const usernameQuery = `username=${encodeURIComponent(currentUser.username)}`;
       let url;
       let method;
 
-      try {
-        if (announcementId) {
-          // Update existing announcement
-          url = `/announcements/${announcementId}`;
-          method = "PUT";
-        } else {
-          // Create new announcement
-          url = "/announcements";
-          method = "POST";
-        }
+      if (announcementId) {
+        // Update existing announcement
+        url = `/announcements/${announcementId}?${usernameQuery}`;
+        method = "PUT";
+      } else {
+        // Create new announcement
+        url = `/announcements?${usernameQuery}`;
+        method = "POST";
+      }
 
-        const payload = {
-          message: message,
-          expiration_date: expirationDate,
-          username: currentUser.username,
-        };
+      const payload = {
+        message: message,
+        expiration_date: expirationDate,
+      };
 
-        if (startDate) {
-          payload.start_date = startDate;
-        }
+      if (startDate) {
+        payload.start_date = startDate;
+      } else if (announcementId) {
+        // An empty string tells the API to clear an existing start date
+        payload.start_date = "";
+      }
 
-        const response = await fetch(url, {
-          method,
-          headers: {
-            "Content-Type": "application/json",
-          },
-          body: JSON.stringify(payload),
-        });
+      const response = await fetch(url, {
+        method,
+        headers: {
+          "Content-Type": "application/json",
+        },
+        body: JSON.stringify(payload),
+      });
 
-        if (!response.ok) {
-          const data = await response.json();
-          showAnnouncementMessage(data.detail || "Failed to save announcement", "error");
-          return;
-        }
-      } catch (error) {
-        console.error("Error saving announcement:", error);
+      if (!response.ok) {
+        const data = await response.json();
+        // Validation errors (422) return a list of error objects
+        const detail = Array.isArray(data.detail)
+          ? data.detail[0]?.msg?.replace(/^Value error, /, "")
+          : data.detail;
+        showAnnouncementMessage(detail || "Failed to save announcement", "error");
+        return;
       }
       
       const successMessage = announcementId 